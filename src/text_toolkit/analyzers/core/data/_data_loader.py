@@ -1,5 +1,6 @@
 import json
 from collections.abc import Generator
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -67,9 +68,13 @@ class DataLoader:
         return (item for item in set(items))
 
     @classmethod
+    @cache
     def load_stopwords(cls) -> dict[str, set[str]]:
         """Specialized loader for stopwords with schema validation.
 
+        Cached: every analyzer instance shares the same parsed tables, so
+        callers must treat the returned sets as read-only.
+
         Returns:
             dict[str, set[str]]: Mapping of language codes to sets of stopwords.
         """
@@ -77,9 +82,13 @@ class DataLoader:
         return {lang: set(words) for lang, words in data.items()}
 
     @classmethod
+    @cache
     def load_sentiment_words(cls) -> tuple[set[str], set[str]]:
         """Specialized loader for sentiment words.
 
+        Cached: every analyzer instance shares the same parsed tables, so
+        callers must treat the returned sets as read-only.
+
         Returns:
             tuple[set[str], set[str]]: (positive_words, negative_words)
         """
@@ -89,9 +98,12 @@ class DataLoader:
         return pos, neg
 
     @classmethod
+    @cache
     def load_readability_thresholds(cls) -> "ReadabilityConfig":
         """Specialized loader for readability thresholds with Pydantic validation.
 
+        Cached: repeated analyzer construction revalidates nothing.
+
         Returns:
             ReadabilityConfig: Validated configuration object.
         """
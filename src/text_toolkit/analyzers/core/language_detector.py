@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from text_toolkit.models.text_document import TextDocument
@@ -16,9 +17,19 @@ class LanguageDetector:
     from a set of supported languages (es, en, fr, de, it, pt).
     """
 
-    def __init__(self) -> None:
-        """Initializes the LanguageDetector by loading stopwords from JSON."""
-        self._stopwords: dict[str, set[str]] = DataLoader.load_stopwords()
+    def __init__(self, languages: Iterable[str] | None = None) -> None:
+        """Initializes the LanguageDetector by loading stopwords from JSON.
+
+        Args:
+            languages: Optional subset of language codes to score against.
+                Defaults to every language in the bundled stopword tables;
+                narrowing it shrinks the working set and the scoring loop.
+        """
+        stopwords = DataLoader.load_stopwords()
+        if languages is not None:
+            wanted = set(languages)
+            stopwords = {lang: words for lang, words in stopwords.items() if lang in wanted}
+        self._stopwords: dict[str, set[str]] = stopwords
         logger.debug("Initialized %r", self)
 
     def analyze(self, document: TextDocument) -> dict[str, Any]:
@@ -45,6 +56,10 @@ class LanguageDetector:
             intersection = words.intersection(words_list)
             scores[lang] = len(intersection) / len(words_list) if words_list else 0.0
 
+        # No candidate languages (e.g. languages=[] or an unknown subset)
+        if not scores:
+            return {"language": "unknown", "confidence": 0.0}
+
         best_lang = max(scores, key=lambda lang_code: scores[lang_code])
         confidence = scores[best_lang]
 
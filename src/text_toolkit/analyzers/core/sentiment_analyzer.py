@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 from typing import Any
 
 from text_toolkit.models.text_document import TextDocument
@@ -41,8 +42,12 @@ class SentimentAnalyzer:
         if not words:
             return self._empty_result()
 
-        pos_count = sum(1 for w in words if w in self._pos_words)
-        neg_count = sum(1 for w in words if w in self._neg_words)
+        # Counting distinct words once and intersecting key views with the
+        # keyword sets keeps the per-token work in C; repeated words still
+        # contribute their full frequency.
+        counts = Counter(words)
+        pos_count = sum(counts[w] for w in counts.keys() & self._pos_words)
+        neg_count = sum(counts[w] for w in counts.keys() & self._neg_words)
         total_sentiment_words = pos_count + neg_count
 
         score = (
@@ -65,6 +70,19 @@ class SentimentAnalyzer:
         )
         return result
 
+    def analyze_batch(self, documents: list[TextDocument]) -> list[dict[str, Any]]:
+        """
+        Analyzes the sentiment of several documents in one call.
+
+        Args:
+            documents (list[TextDocument]): The documents to analyze.
+
+        Returns:
+            list[dict[str, Any]]: One analyze() result dict per document.
+        """
+        logger.info("Analyzing sentiment for batch of %d documents", len(documents))
+        return [self.analyze(document) for document in documents]
+
     def _get_label(self, score: float) -> str:
         if score > 0.1:
             return "positive"
@@ -1,6 +1,7 @@
 import argparse
 import logging
 import sys
+from functools import cache
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -31,12 +32,12 @@ def setup_logging(verbosity: int) -> None:
         handlers=[RichHandler(console=console, rich_tracebacks=True, show_path=False)],
     )
 
-def parse_arguments() -> argparse.Namespace:
-    """
-    Parses command-line arguments using RichHelpFormatter for a better interface.
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser once per process.
 
-    Returns:
-        argparse.Namespace: Parsed arguments.
+    add_argument chains are surprisingly costly; repeated parse calls
+    (tests, programmatic use) reuse the cached parser.
     """
     parser = argparse.ArgumentParser(
         prog="text-toolkit",
@@ -121,19 +122,39 @@ def parse_arguments() -> argparse.Namespace:
         help="Specify which transformers to run. Options: Cleaner, Normalizer, Tokenizer (required).", # noqa: E501
     )
 
-    return parser.parse_args()
+    return parser
 
 
-def apply_transformers(
-    content: str, transformer_names: list[str] | None, verbose: bool
-) -> str:
-    """Applies specified transformers to content and returns the final output."""
-    transformer_map = {
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses command-line arguments using RichHelpFormatter for a better interface.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    return _build_parser().parse_args()
+
+
+@cache
+def _transformer_map() -> dict[str, Cleaner | Normalizer | Tokenizer]:
+    """Build the name-to-transformer registry once per process.
+
+    The transformers hold no per-call state, so every CLI invocation can
+    share the same instances (and their compiled patterns and tables).
+    """
+    return {
         "Cleaner": Cleaner(),
         "Normalizer": Normalizer(),
         "Tokenizer": Tokenizer(),
     }
 
+
+def apply_transformers(
+    content: str, transformer_names: list[str] | None, verbose: bool
+) -> str:
+    """Applies specified transformers to content and returns the final output."""
+    transformer_map = _transformer_map()
+
     if transformer_names is None:
         transformer_names = list(transformer_map.keys())
 
@@ -159,11 +180,7 @@ def collect_transformer_results(
     content: str, transformer_names: list[str] | None, verbose: bool
 ) -> dict[str, str]:
     """Applies specified transformers to content and returns all intermediate outputs."""
-    transformer_map = {
-        "Cleaner": Cleaner(),
-        "Normalizer": Normalizer(),
-        "Tokenizer": Tokenizer(),
-    }
+    transformer_map = _transformer_map()
 
     if transformer_names is None:
         transformer_names = list(transformer_map.keys())
@@ -1,6 +1,10 @@
 """Display functions for CLI output formatting."""
 
 import json
+from collections.abc import Callable
+from functools import cache
+from itertools import islice
+from operator import attrgetter
 from typing import Any
 
 from rich.console import Console
@@ -23,42 +27,62 @@ def _get_active_extractors(extractor_results: ExtractionResult) -> tuple[bool, b
     Returns:
         Tuple of (show_emails, show_urls, show_dates) boolean flags.
     """
-    active_extractors = extractor_results.active_extractors or []
-    show_emails = 'email' in active_extractors
-    show_urls = 'url' in active_extractors
-    show_dates = 'date' in active_extractors
-    return show_emails, show_urls, show_dates
+    active = extractor_results.active_extractor_set
+    return 'email' in active, 'url' in active, 'date' in active
 
 
-def _build_extraction_data_for_json(extractor_results: ExtractionResult) -> dict[str, Any]:
+@cache
+def _make_json_builder(
+    active: frozenset[str],
+) -> Callable[[ExtractionResult], dict[str, Any]]:
     """
-    Builds the extraction data dictionary for JSON output.
+    Builds a JSON-data builder specialized for a set of active extractors.
+
+    The branching on which extractors are active is resolved once per
+    configuration; the returned closure just walks the precomputed field
+    specs for every document that shares it.
 
     Args:
-        extractor_results: The extraction result object.
+        active: Set of active extractor keys ('email', 'url', 'date').
 
     Returns:
-        Dictionary containing extraction data and summary.
+        Callable turning an ExtractionResult into its JSON extraction data.
     """
-    show_emails, show_urls, show_dates = _get_active_extractors(extractor_results)
+    specs = [
+        (json_key, summary_key, attrgetter(attr))
+        for key, json_key, summary_key, attr in (
+            ("email", "emails", "total_emails", "email_matches"),
+            ("url", "urls", "total_urls", "url_matches"),
+            ("date", "dates", "total_dates", "date_matches"),
+        )
+        if key in active
+    ]
 
-    extraction_data: dict[str, Any] = {}
-    summary: dict[str, int] = {}
+    def build(extractor_results: ExtractionResult) -> dict[str, Any]:
+        extraction_data: dict[str, Any] = {}
+        summary: dict[str, int] = {}
+        for json_key, summary_key, get_matches in specs:
+            matches = get_matches(extractor_results)
+            extraction_data[json_key] = matches
+            summary[summary_key] = len(matches)
+        extraction_data["summary"] = summary
+        return extraction_data
 
-    if show_emails:
-        extraction_data["emails"] = extractor_results.email_matches
-        summary["total_emails"] = len(extractor_results.email_matches)
+    return build
 
-    if show_urls:
-        extraction_data["urls"] = extractor_results.url_matches
-        summary["total_urls"] = len(extractor_results.url_matches)
 
-    if show_dates:
-        extraction_data["dates"] = extractor_results.date_matches
-        summary["total_dates"] = len(extractor_results.date_matches)
+def _build_extraction_data_for_json(extractor_results: ExtractionResult) -> dict[str, Any]:
+    """
+    Builds the extraction data dictionary for JSON output.
 
-    extraction_data["summary"] = summary
-    return extraction_data
+    Args:
+        extractor_results: The extraction result object.
+
+    Returns:
+        Dictionary containing extraction data and summary.
+    """
+    builder = _make_json_builder(extractor_results.active_extractor_set)
+    return builder(extractor_results)
 
 
 def _build_json_output(
@@ -86,6 +110,31 @@ def _build_json_output(
     return output_data
 
 
+def _make_analysis_table() -> Table:
+    """Builds an empty analysis table with its columns pre-configured."""
+    table = Table(
+        title="[bold blue]Analysis Summary[/bold blue]",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Metric", style="dim", width=25)
+    table.add_column("Value", style="bold green")
+    return table
+
+
+def _make_extraction_table() -> Table:
+    """Builds an empty extraction table with its columns pre-configured."""
+    table = Table(
+        title="[bold cyan]Extracted Data[/bold cyan]",
+        show_header=True,
+        header_style="bold blue",
+    )
+    table.add_column("Type", style="dim", width=15)
+    table.add_column("Count", style="bold yellow", width=10)
+    table.add_column("Samples", style="bold green")
+    return table
+
+
 def _format_analyzer_value(value: Any) -> str:
     """
     Formats an analyzer value for display in a table.
@@ -98,7 +147,7 @@ def _format_analyzer_value(value: Any) -> str:
     """
     if isinstance(value, dict):
         # Format sub-dictionaries (like top words) as a more readable string
-        val_str = ", ".join([f"{k}: {v}" for k, v in list(value.items())[:5]])
+        val_str = ", ".join(f"{k}: {v}" for k, v in islice(value.items(), 5))
         if len(value) > 5:
             val_str += " ..."
         return val_str
@@ -112,13 +161,7 @@ def _display_analysis_table(analyzer_results: dict[str, Any]) -> None:
     Args:
         analyzer_results: Dictionary containing analysis metrics.
     """
-    table = Table(
-        title="[bold blue]Analysis Summary[/bold blue]",
-        show_header=True,
-        header_style="bold magenta",
-    )
-    table.add_column("Metric", style="dim", width=25)
-    table.add_column("Value", style="bold green")
+    table = _make_analysis_table()
 
     for key, value in analyzer_results.items():
         formatted_key = key.replace("_", " ").title()
@@ -141,7 +184,7 @@ def _format_extraction_sample(matches: list[str], max_samples: int = 3) -> str:
     Returns:
         Formatted string with samples.
     """
-    sample = ", ".join(matches[:max_samples])
+    sample = ", ".join(islice(matches, max_samples))
     if len(matches) > max_samples:
         sample += " ..."
     return sample or "(none)"
@@ -154,14 +197,7 @@ def _display_extraction_table(extractor_results: ExtractionResult) -> None:
     Args:
         extractor_results: The extraction result object.
     """
-    extraction_table = Table(
-        title="[bold cyan]Extracted Data[/bold cyan]",
-        show_header=True,
-        header_style="bold blue",
-    )
-    extraction_table.add_column("Type", style="dim", width=15)
-    extraction_table.add_column("Count", style="bold yellow", width=10)
-    extraction_table.add_column("Samples", style="bold green")
+    extraction_table = _make_extraction_table()
 
     show_emails, show_urls, show_dates = _get_active_extractors(extractor_results)
 
@@ -1,6 +1,8 @@
 """Execution and document loading functions for CLI."""
 
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from text_toolkit.analyzers import AnalyzerRunner
@@ -10,6 +12,20 @@ from text_toolkit.readers import HtmlReader, MarkdownReader, TxtReader
 from text_toolkit.transformers import Cleaner, Normalizer, Tokenizer, TransformerPipeline
 
 
+@cache
+def _cli() -> ModuleType:
+    """
+    Returns the text_toolkit.cli module, imported once on first use.
+
+    cli.py imports this module at startup, so importing it back at module
+    level would create a circular import; the cached accessor defers the
+    import to first call and amortizes it to a single dict lookup.
+    """
+    import text_toolkit.cli
+
+    return text_toolkit.cli
+
+
 def _get_reader_for_path(file_path: Path):
     """
     Selects the appropriate reader based on file extension.
@@ -39,17 +55,19 @@ def _load_document(input_path: str, verbose: bool) -> TextDocument:
     Returns:
         TextDocument instance ready for processing.
     """
-    from text_toolkit.cli import log_info
-
     input_file = Path(input_path)
+    log_info = _cli().log_info
     log_info("Reading document...", verbose)
 
     reader = _get_reader_for_path(input_file)
     reader_name = reader.__class__.__name__
     log_info(f"Using {reader_name} for {input_file.name}", verbose)
 
-    lines = list(reader.read(input_file))
-    content = "\n".join(lines)
+    if isinstance(reader, TxtReader):
+        # Plain text: one bulk read, no intermediate line list.
+        content = reader.read_text(input_file)
+    else:
+        content = "\n".join(reader.read(input_file))
 
     log_info("Initializing processing pipeline...", verbose)
     cleaner = Cleaner()
@@ -99,9 +117,7 @@ def _run_transformers_only(
     Returns:
         Dictionary mapping transformer names to their output.
     """
-    from text_toolkit.cli import collect_transformer_results
-
-    return collect_transformer_results(content, transformer_names, verbose)
+    return _cli().collect_transformer_results(content, transformer_names, verbose)
 
 
 def _apply_transformers_to_content(
@@ -118,9 +134,7 @@ def _apply_transformers_to_content(
     Returns:
         Final transformed content string.
     """
-    from text_toolkit.cli import apply_transformers
-
-    return apply_transformers(content, transformer_names, verbose)
+    return _cli().apply_transformers(content, transformer_names, verbose)
 
 
 def _run_analyzers(
@@ -137,8 +151,7 @@ def _run_analyzers(
     Returns:
         Dictionary containing analysis results.
     """
-    from text_toolkit.cli import log_info
-
+    log_info = _cli().log_info
     log_info("Running linguistic analysis...", verbose)
     analyzer_runner = AnalyzerRunner(analyzer_names=analyzer_names)
     return analyzer_runner.analyze(document)
@@ -158,8 +171,7 @@ def _run_extractors(
     Returns:
         ExtractionResult containing all extracted data.
     """
-    from text_toolkit.cli import log_info
-
+    log_info = _cli().log_info
     log_info("Running extractors...", verbose)
     extractor_runner = ExtractorRunner(extractor_names=extractor_names)
     result = extractor_runner.extract_all(document)
@@ -187,8 +199,7 @@ def process_document(
         Tuple of (analyzer_results, extractor_results, transformer_results).
         transformer_results is only populated when transformers run standalone.
     """
-    from text_toolkit.cli import log_info
-
+    log_info = _cli().log_info
     log_info(f"Starting processing of: {config.input_path}", config.verbose)
 
     document = _load_document(config.input_path, config.verbose)
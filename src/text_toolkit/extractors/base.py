@@ -1,7 +1,7 @@
 import logging
 import re
 from re import Pattern
-from typing import Protocol, runtime_checkable
+from typing import ClassVar, Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
 
@@ -34,25 +34,58 @@ class RegexExtractor:
 
     _regex_pattern_list: list[Pattern[str]]
 
+    # Literals of which at least one must appear for any pattern to match.
+    # Subclasses override; the default empty tuple disables the prefilter.
+    # str.find runs at memchr speed, so rejecting a document here is far
+    # cheaper than letting the regex engine scan it for nothing.
+    _quick_reject: ClassVar[tuple[str, ...]] = ()
+
+    # Compiled patterns shared across instances: building a second
+    # extractor with the same pattern reuses the compiled program instead
+    # of recompiling (re's own cache is small and evictable).
+    _compiled_cache: ClassVar[dict[str, Pattern[str]]] = {}
+
     def __init__(self, pattern_list: list[str]) -> None:
         """
         Initialize extractor with a list of regex patterns.
         """
         self._regex_pattern_list = []
+        self._union_pattern: Pattern[str] | None = None
         self.add_patterns(pattern_list)
 
     def add_patterns(self, patterns: list[str]) -> None:
         """
         Add multiple patterns to the extractor.
         """
+        cache = RegexExtractor._compiled_cache
         for pattern in patterns:
-            try:
-                compiled_pattern = re.compile(pattern)
-                self._regex_pattern_list.append(compiled_pattern)
-                logger.debug("Added pattern: %s", pattern)
-            except re.error as exc:
-                logger.error("Invalid regex pattern: %s", pattern)
-                raise ValueError(f"Invalid regex pattern: {pattern}") from exc
+            compiled_pattern = cache.get(pattern)
+            if compiled_pattern is None:
+                try:
+                    compiled_pattern = re.compile(pattern)
+                except re.error as exc:
+                    logger.error("Invalid regex pattern: %s", pattern)
+                    raise ValueError(f"Invalid regex pattern: {pattern}") from exc
+                cache[pattern] = compiled_pattern
+            self._regex_pattern_list.append(compiled_pattern)
+            logger.debug("Added pattern: %s", pattern)
+
+        # The finditer fast path only applies to a single group-free
+        # pattern, where it is equivalent to findall. Multiple patterns
+        # cannot be fused into one alternation: overlapping patterns would
+        # drop matches (alternation consumes text, findall-per-pattern
+        # reports both), backreference numbering would shift across
+        # branches, and findall's return-the-group contract would break.
+        # Those cases take the per-pattern findall loop in extract.
+        if len(self._regex_pattern_list) == 1 and not self._regex_pattern_list[0].groups:
+            self._union_pattern = self._regex_pattern_list[0]
+        else:
+            self._union_pattern = None
+
+    @property
+    def patterns(self) -> list[str]:
+        """Return the registered regex patterns as strings."""
+        return [item.pattern for item in self._regex_pattern_list]
 
     def extract(self, text: str, unique_occurrences: bool = False) -> list[str]:
         """
@@ -71,24 +104,29 @@ class RegexExtractor:
             List of matched strings
         """
         if not text:
-            logger.warning("Empty text provided for extraction")
             return []
 
-        logger.debug(
-            "Starting extraction on text of length %d with %d patterns",
-            len(text),
-            len(self._regex_pattern_list),
-        )
-        results = []
-        for pattern in self._regex_pattern_list:
-            matches = pattern.findall(text)
-            if matches:
-                logger.debug("Pattern '%s' found %d matches", pattern.pattern, len(matches))
-            results.extend(matches)
+        if self._quick_reject and not any(token in text for token in self._quick_reject):
+            return []
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Starting extraction on text of length %d with %d patterns",
+                len(text),
+                len(self._regex_pattern_list),
+            )
+        results: list[str] = []
+        if self._union_pattern is not None:
+            results = [match.group() for match in self._union_pattern.finditer(text)]
+        else:
+            # Multiple patterns or capturing groups: findall per pattern so
+            # overlaps, group extraction and backreferences all behave
+            # exactly as registered.
+            for pattern in self._regex_pattern_list:
+                results.extend(pattern.findall(text))
         if unique_occurrences:
+            # dict.fromkeys dedups in one C loop, keeping first-seen order.
             results = list(dict.fromkeys(results))
-            logger.debug("Removed duplicates, %d unique matches remain", len(results))
 
         logger.info(
             "Extraction completed: found %d matches (unique_occurrences=%s)",
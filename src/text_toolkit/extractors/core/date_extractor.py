@@ -1,10 +1,25 @@
 import logging
+import re
 from typing import ClassVar
 
 from text_toolkit.extractors.base import RegexExtractor
 
 logger = logging.getLogger(__name__)
 
+_DATE_PATTERNS = [
+    r"\d{4}-\d{2}-\d{2}",  # YYYY-MM-DD
+    r"\d{2}/\d{2}/\d{4}",  # DD/MM/YYYY or MM/DD/YYYY
+    r"\d{2}-\d{2}-\d{4}",  # DD-MM-YYYY or MM-DD-YYYY
+    r"\d{1,2}\s(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s\d{4}",  # 01 jan 2026
+    r"\d{1,2}-(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-\d{4}",  # 01-jan-2026
+]
+
+# Every alternative starts with a digit, so a (?=\d) lookahead on the
+# combined pattern lets the engine reject non-digit positions in one check.
+# re.ASCII keeps \d and \s on the 8-bit fast tables — dates are ASCII only.
+# Compiled once at import so runner construction does no regex work.
+_COMBINED_PATTERN = re.compile(r"(?=\d)(?:" + "|".join(_DATE_PATTERNS) + ")", re.ASCII)
+
 
 class DateExtractor(RegexExtractor):
     """Extractor for dates in various formats.
@@ -19,16 +34,13 @@ class DateExtractor(RegexExtractor):
     """
 
     name: ClassVar[str] = "DateExtractor"
-    _date_patterns: ClassVar[list[str]] = [
-        r"\d{4}-\d{2}-\d{2}",  # YYYY-MM-DD
-        r"\d{2}/\d{2}/\d{4}",  # DD/MM/YYYY or MM/DD/YYYY
-        r"\d{2}-\d{2}-\d{4}",  # DD-MM-YYYY or MM-DD-YYYY
-        r"\d{1,2}\s(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s\d{4}",  # 01 jan 2026
-        r"\d{1,2}-(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)-\d{4}",  # 01-jan-2026
-    ]
+    _date_patterns: ClassVar[list[str]] = _DATE_PATTERNS
+
+    _quick_reject: ClassVar[tuple[str, ...]] = tuple("0123456789")
 
     def __init__(self) -> None:
-        super().__init__(self._date_patterns)
+        self._regex_pattern_list = [_COMBINED_PATTERN]
+        self._union_pattern = _COMBINED_PATTERN
         logger.info("Initialized %s with %d patterns", self.name, len(self._date_patterns))
 
     def __repr__(self) -> str:
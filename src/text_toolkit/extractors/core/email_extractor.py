@@ -1,10 +1,21 @@
 import logging
+import re
 from typing import ClassVar
 
 from text_toolkit.extractors.base import RegexExtractor
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_PATTERNS = [
+    r"(?=[\w.])\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",  # Standard email
+]
+
+# Unicode \b on purpose: under re.ASCII accented letters count as
+# non-word, so "peña@example.com" would yield a truncated
+# "a@example.com" match in the Spanish corpora this toolkit handles.
+# Compiled once at import so runner construction does no regex work.
+_COMBINED_PATTERN = re.compile("|".join(f"(?:{p})" for p in _EMAIL_PATTERNS))
+
 
 class EmailExtractor(RegexExtractor):
     """Extractor for email addresses.
@@ -15,12 +26,13 @@ class EmailExtractor(RegexExtractor):
     """
 
     name: ClassVar[str] = "EmailExtractor"
-    _email_patterns: ClassVar[list[str]] = [
-        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",  # Standard email
-    ]
+    _email_patterns: ClassVar[list[str]] = _EMAIL_PATTERNS
+
+    _quick_reject: ClassVar[tuple[str, ...]] = ("@",)
 
     def __init__(self) -> None:
-        super().__init__(self._email_patterns)
+        self._regex_pattern_list = [_COMBINED_PATTERN]
+        self._union_pattern = _COMBINED_PATTERN
         logger.info("Initialized %s with %d patterns", self.name, len(self._email_patterns))
 
     def __repr__(self) -> str:
@@ -1,10 +1,24 @@
 import logging
+import re
 from typing import ClassVar
 
 from text_toolkit.extractors.base import RegexExtractor
 
 logger = logging.getLogger(__name__)
 
+_URL_PATTERNS = [
+    r"https?://[-\w./?%&=+#]+",  # HTTP/HTTPS URLs
+    r"ftp://[-\w./?%&=+#]+",  # FTP URLs
+    r"www\.[-\w./?%&=+#]+",  # www URLs without protocol
+]
+
+# One alternation means one linear scan of the document instead of one
+# full scan per protocol pattern.
+# Unicode \w on purpose: IRIs like example.com/España appear unencoded
+# in real documents, and an ASCII \w would truncate them mid-path.
+# Compiled once at import so runner construction does no regex work.
+_COMBINED_PATTERN = re.compile("|".join(f"(?:{p})" for p in _URL_PATTERNS))
+
 
 class URLExtractor(RegexExtractor):
     """Extractor for URLs
@@ -18,14 +32,13 @@ class URLExtractor(RegexExtractor):
     """
 
     name: ClassVar[str] = "URLExtractor"
-    _url_patterns: ClassVar[list[str]] = [
-        r"https?://(?:[-\w./?%&=+#]|(?:%[\da-fA-F]{2}))+",  # HTTP/HTTPS URLs
-        r"ftp://(?:[-\w./?%&=+#]|(?:%[\da-fA-F]{2}))+",  # FTP URLs
-        r"www\.(?:[-\w./?%&=+#]|(?:%[\da-fA-F]{2}))+",  # www URLs without protocol
-    ]
+    _url_patterns: ClassVar[list[str]] = _URL_PATTERNS
+
+    _quick_reject: ClassVar[tuple[str, ...]] = ("://", "www.")
 
     def __init__(self) -> None:
-        super().__init__(self._url_patterns)
+        self._regex_pattern_list = [_COMBINED_PATTERN]
+        self._union_pattern = _COMBINED_PATTERN
         logger.info("Initialized %s with %d patterns", self.name, len(self._url_patterns))
 
     def __repr__(self) -> str:
@@ -1,4 +1,7 @@
+import bisect
 import logging
+import sys
+from collections.abc import Iterable
 
 from text_toolkit.extractors.core import DateExtractor, EmailExtractor, URLExtractor
 from text_toolkit.models.extraction_result import ExtractionResult
@@ -6,6 +9,14 @@ from text_toolkit.models.text_document import TextDocument
 
 logger = logging.getLogger(__name__)
 
+# Declarative registry: class name -> (result key, class). Built once at
+# import instead of two throwaway dicts per runner construction.
+_EXTRACTOR_REGISTRY: dict[str, tuple[str, type]] = {
+    'EmailExtractor': ('email', EmailExtractor),
+    'URLExtractor': ('url', URLExtractor),
+    'DateExtractor': ('date', DateExtractor),
+}
+
 
 class ExtractorRunner:
     """
@@ -57,37 +68,34 @@ class ExtractorRunner:
             'EmailExtractor', 'URLExtractor', 'DateExtractor'.
             If None, all extractors are initialized.
         """
-        # Map extractor class names to their classes and keys
-        name_to_class = {
-            'EmailExtractor': EmailExtractor,
-            'URLExtractor': URLExtractor,
-            'DateExtractor': DateExtractor,
-        }
-
-        name_to_key = {
-            'EmailExtractor': 'email',
-            'URLExtractor': 'url',
-            'DateExtractor': 'date',
-        }
-
         self.extractors = {}
 
         if extractor_names:
             # only specified extractors - create only those requested
             for name in extractor_names:
-                if name in name_to_key and name in name_to_class:
-                    key = name_to_key[name]
-                    self.extractors[key] = name_to_class[name]()
-                else:
+                spec = _EXTRACTOR_REGISTRY.get(name)
+                if spec is None:
                     logger.warning("Unknown extractor name: %s", name)
+                    continue
+                key, cls = spec
+                self.extractors[key] = cls()
             logger.info("Initialized ExtractorRunner with specific extractors: %s", extractor_names)
         else:
             # all extractors - create all of them
-            for name, cls in name_to_class.items():
-                key = name_to_key[name]
+            for key, cls in _EXTRACTOR_REGISTRY.values():
                 self.extractors[key] = cls()
             logger.info("Initialized ExtractorRunner with all core extractors")
 
+        # Single-slot scan cache: repeat extraction of the same (unmutated)
+        # content string skips the scan entirely. Identity comparison keeps
+        # it exact without hashing megabytes of text. Only the raw match
+        # lists are cached — every call builds a fresh ExtractionResult,
+        # because the result's list fields are a mutable contract and a
+        # shared instance would let one caller corrupt the next read.
+        self._last_content: str | None = None
+        self._last_unique: bool = True
+        self._last_matches: dict[str, list[str]] | None = None
+
         logger.debug("Active extractors: %s", list(self.extractors.keys()))
         logger.info("ExtractorRunner initialized successfully")
 
@@ -122,34 +130,68 @@ class ExtractorRunner:
         >>> len(result.url_matches)
         0
         """
-        if document.is_empty():
-            logger.warning("Document is empty, returning empty extraction result")
-            return ExtractionResult()
+        return self.extract_all_str(document.content, unique_occurrences=unique_occurrences)
+
+    def extract_all_str(self, content: str, unique_occurrences: bool = True) -> ExtractionResult:
+        """
+        Extract emails, URLs, and dates from a raw string.
 
-        logger.info("Starting extraction on document (content length: %d)", len(document.content))
+        Fast path for callers that only have text: skips the TextDocument
+        allocation (and its pipeline attachment) entirely. extract_all
+        delegates here, so both entry points share one implementation.
 
-        # Extract using only active extractors
-        email_matches = []
-        url_matches = []
-        date_matches = []
+        Parameters
+        ----------
+        content : str
+            The text to extract data from
+        unique_occurrences : bool, optional
+            Whether to remove duplicate matches (default is True)
+
+        Returns
+        -------
+        ExtractionResult
+            Object containing all extracted emails, URLs, and dates
+        """
+        if not content or content.isspace():
+            logger.warning("Document is empty, returning empty extraction result")
+            return ExtractionResult()
 
-        if 'email' in self.extractors:
-            email_matches = self.extractors['email'].extract(document.content)
-            logger.debug("Extracted %d emails", len(email_matches))
+        if (
+            self._last_matches is not None
+            and content is self._last_content
+            and unique_occurrences == self._last_unique
+        ):
+            logger.debug("Returning cached extraction result")
+            matches_by_key = {key: list(values) for key, values in self._last_matches.items()}
+        else:
+            logger.info(
+                "Starting extraction on document (content length: %d)", len(content)
+            )
 
-        if 'url' in self.extractors:
-            url_matches = self.extractors['url'].extract(document.content)
-            logger.debug("Extracted %d URLs", len(url_matches))
+            # One scan per extractor, not one fused alternation: separate
+            # scans keep overlapping matches, so a date inside a URL is
+            # reported by both extractors. Each extractor still
+            # quick-rejects and dedups (dict.fromkeys) in C on its own.
+            matches_by_key = {
+                key: extractor.extract(content, unique_occurrences=unique_occurrences)
+                for key, extractor in self.extractors.items()
+            }
 
-        if 'date' in self.extractors:
-            date_matches = self.extractors['date'].extract(document.content)
-            logger.debug("Extracted %d dates", len(date_matches))
+            self._last_content = content
+            self._last_unique = unique_occurrences
+            # Copies, so mutation of the returned result cannot reach the
+            # cache either.
+            self._last_matches = {key: list(values) for key, values in matches_by_key.items()}
 
-        if unique_occurrences:
-            email_matches = list(dict.fromkeys(email_matches))
-            url_matches = list(dict.fromkeys(url_matches))
-            date_matches = list(dict.fromkeys(date_matches))
-            logger.debug("Applied unique_occurrences filter")
+        email_matches = matches_by_key.get('email', [])
+        url_matches = matches_by_key.get('url', [])
+        date_matches = matches_by_key.get('date', [])
+        logger.debug(
+            "Extracted %d emails, %d URLs, %d dates",
+            len(email_matches),
+            len(url_matches),
+            len(date_matches),
+        )
 
         logger.info(
             "Extraction completed: %d emails, %d URLs, %d dates",
@@ -168,6 +210,131 @@ class ExtractorRunner:
         logger.debug("Extraction result: %r", result)
         return result
 
+    # ASCII record separator: never matched by the core patterns, so a
+    # match can never straddle two joined documents.
+    _batch_sep = "\x1e"
+
+    def extract_all_batch(
+        self, documents: list[TextDocument], unique_occurrences: bool = True
+    ) -> list[ExtractionResult]:
+        """
+        Extract emails, URLs, and dates from several documents in one scan
+        per extractor.
+
+        The contents are joined with a record separator and each extractor's
+        pattern walks the combined text once, so the per-document regex
+        entry cost is paid once per batch. Scans stay separate per extractor
+        so overlapping matches are kept; matches are routed back to their
+        document by offset.
+
+        Parameters
+        ----------
+        documents : list[TextDocument]
+            The documents to extract data from
+        unique_occurrences : bool, optional
+            Whether to remove duplicate matches per document (default is True)
+
+        Returns
+        -------
+        list[ExtractionResult]
+            One result per input document, in order.
+        """
+        active = list(self.extractors.keys())
+        per_doc: list[dict[str, list[str]]] = [
+            {key: [] for key in self.extractors} for _ in documents
+        ]
+
+        if self.extractors and documents:
+            joined = self._batch_sep.join(document.content for document in documents)
+            # bounds[i] is the end offset (separator included) of document i
+            bounds: list[int] = []
+            end = 0
+            for document in documents:
+                end += len(document.content) + 1
+                bounds.append(end)
+            for key, extractor in self.extractors.items():
+                for pattern in extractor._regex_pattern_list:
+                    for match in pattern.finditer(joined):
+                        index = bisect.bisect_right(bounds, match.start())
+                        per_doc[index][key].append(sys.intern(match.group()))
+
+        results: list[ExtractionResult] = []
+        for matches_by_key in per_doc:
+            if unique_occurrences:
+                for key, values in matches_by_key.items():
+                    matches_by_key[key] = list(dict.fromkeys(values))
+            results.append(
+                ExtractionResult(
+                    email_matches=matches_by_key.get('email', []),
+                    url_matches=matches_by_key.get('url', []),
+                    date_matches=matches_by_key.get('date', []),
+                    active_extractors=active,
+                )
+            )
+        logger.info("Batch extraction completed for %d documents", len(documents))
+        return results
+
+    # How many trailing characters to carry between streamed lines so a
+    # match spanning a line break (e.g. '01 jan\n2026') is still found.
+    _carry_tail = 256
+
+    def extract_all_stream(
+        self, line_iter: Iterable[str], unique_occurrences: bool = True
+    ) -> ExtractionResult:
+        """
+        Extract emails, URLs, and dates from an iterable of lines.
+
+        Unlike extract_all, this never materializes the full document, so
+        memory stays bounded for arbitrarily large inputs. A short tail of
+        each scanned chunk is carried over to the next line so matches that
+        span a line break are not lost.
+
+        Parameters
+        ----------
+        line_iter : Iterable[str]
+            Lines of the document, as yielded by the readers
+        unique_occurrences : bool, optional
+            Whether to remove duplicate matches (default is True)
+
+        Returns
+        -------
+        ExtractionResult
+            Object containing all extracted emails, URLs, and dates
+        """
+        matches_by_key: dict[str, list[str]] = {key: [] for key in self.extractors}
+        seen_by_key: dict[str, set[str]] = {key: set() for key in self.extractors}
+
+        if self.extractors:
+            carry = ""
+            for line in line_iter:
+                chunk = carry + line
+                boundary = len(carry)
+                for key, extractor in self.extractors.items():
+                    for pattern in extractor._regex_pattern_list:
+                        for match in pattern.finditer(chunk):
+                            # Matches ending inside the carried tail were
+                            # already reported on the previous chunk.
+                            if match.end() <= boundary:
+                                continue
+                            value = sys.intern(match.group())
+                            if unique_occurrences:
+                                seen = seen_by_key[key]
+                                if value in seen:
+                                    continue
+                                seen.add(value)
+                            matches_by_key[key].append(value)
+                carry = chunk[-self._carry_tail:] + "\n"
+
+        result = ExtractionResult(
+            email_matches=matches_by_key.get('email', []),
+            url_matches=matches_by_key.get('url', []),
+            date_matches=matches_by_key.get('date', []),
+            active_extractors=list(self.extractors.keys()),
+        )
+
+        logger.info("Streaming extraction completed: %r", result)
+        return result
+
     def __repr__(self) -> str:
         """Return string representation of the runner."""
         extractor_types = list(self.extractors.keys())
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """
     Model for data extracted, merging emails, url and dates ocurrences in the same class
@@ -13,6 +13,16 @@ class ExtractionResult:
     url_matches: list[str] = field(default_factory=list)
     date_matches: list[str] = field(default_factory=list)
     active_extractors: list[str] | None = None
+    # compare=False: this is a lazily built cache, and reading the property
+    # on one of two otherwise-equal results must not make them unequal.
+    _active_set: frozenset[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def active_extractor_set(self) -> frozenset[str]:
+        """Lazy frozenset view of active_extractors for O(1) membership tests."""
+        if self._active_set is None:
+            self._active_set = frozenset(self.active_extractors or ())
+        return self._active_set
 
     def __repr__(self) -> str:
         """Return a concise representation for logging/debugging."""
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from text_toolkit.transformers import TransformerPipeline
 
 
-@dataclass()
+@dataclass(slots=True)
 class TextDocument:
     """
     Represents a document with its content, associated metadata and analysis results.
@@ -23,7 +23,8 @@ class TextDocument:
     def tokens(self) -> list[str]:
         """Lazy loads and returns the list of tokens (words) using the pipeline."""
         if self._tokens is None:
-            self._tokens = self.pipeline.transform(self.content)
+            # Empty documents cannot produce tokens; skip the pipeline.
+            self._tokens = [] if not self.content else self.pipeline.transform(self.content)
         return self._tokens
 
     def add_analysis(self, key: str, result: Any) -> None:
@@ -36,7 +37,8 @@ class TextDocument:
         return key in self.analysis_results
 
     def is_empty(self) -> bool:
-        return not self.content.strip()
+        # isspace() checks in C without allocating the stripped copy
+        return not self.content or self.content.isspace()
 
     def __repr__(self) -> str:
         """Return a concise representation for logging/debugging."""
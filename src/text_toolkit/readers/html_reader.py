@@ -41,7 +41,8 @@ class HtmlReader:
         if not path.exists():
             raise FileNotFoundError(f"{path} does not exist")
 
-        raw_html = "\n".join(self._txt_reader.read(path))
+        # One bulk read instead of a line generator plus a joined copy.
+        raw_html = self._txt_reader.read_text(path)
 
         parser = _HTMLTextExtractor()
         parser.feed(raw_html)
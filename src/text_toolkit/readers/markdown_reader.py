@@ -11,4 +11,6 @@ class MarkdownReader:
         self._txt_reader = TxtReader()
 
     def read(self, path: str | Path) -> Generator[str, None, None]:
+        # TxtReader.read is already bulk-read and splits on translated
+        # newlines only (str.splitlines would also break on \x0c etc.).
         yield from self._txt_reader.read(path)
@@ -2,20 +2,53 @@ import logging
 import re
 import unicodedata
 
+logger = logging.getLogger(__name__)
 
-class Normalizer:
-    """Normalize text: lowercase, strip, remove accents"""
 
-    def normalize_text(self, text: str) -> str:
+def _build_accent_table() -> dict[int, str]:
+    """Precompute accent stripping + lowercasing for the Latin ranges.
 
-        logging.info("Starting text normalizing...")
+    Maps each accented codepoint to its lowercased NFKD decomposition with
+    combining marks removed, and A-Z to a-z, so the common Latin case is
+    one str.translate call instead of lower + normalize + filter passes.
+    """
+    table: dict[int, str] = {code: chr(code + 0x20) for code in range(0x41, 0x5B)}
+    for code in range(0x00C0, 0x0250):
+        char = chr(code)
+        stripped = "".join(
+            c for c in unicodedata.normalize("NFKD", char) if not unicodedata.combining(c)
+        ).lower()
+        if stripped != char:
+            table[code] = stripped
+    return table
 
-        text = text.strip().lower()
 
-        text = unicodedata.normalize("NFKD", text)
-        text = "".join(char for char in text if not unicodedata.combining(char))
-        text = re.sub(r"\s+", " ", text)
+_ACCENT_TABLE = _build_accent_table()
 
-        logging.info("File normalize completed!")
 
-        return text
+class Normalizer:
+    """Normalize text: lowercase, strip, remove accents"""
+
+    _ws_re = re.compile(r"\s+")
+
+    def normalize_text(self, text: str) -> str:
+
+        logger.info("Starting text normalizing...")
+
+        return self._normalize_one(text)
+
+    def normalize_batch(self, texts: list[str]) -> list[str]:
+        """Normalize several texts with a single log entry for the whole batch."""
+        logger.info("Normalizing batch of %d texts", len(texts))
+        return [self._normalize_one(text) for text in texts]
+
+    def _normalize_one(self, text: str) -> str:
+        # One C-level translate lowercases and strips accents across the
+        # Latin ranges, replacing a separate lower() pass. Only if
+        # non-ASCII codepoints remain (scripts outside the table) does the
+        # general lower + NFKD + combining-mark filter run.
+        text = text.strip().translate(_ACCENT_TABLE)
+        if not text.isascii():
+            text = unicodedata.normalize("NFKD", text.lower())
+            text = "".join(char for char in text if not unicodedata.combining(char))
+        return self._ws_re.sub(" ", text)
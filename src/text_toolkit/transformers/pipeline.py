@@ -30,6 +30,10 @@ class TransformerPipeline:
         Returns:
             list[str]: Resulting tokens.
         """
+        # Tokenize-only pipelines go straight to the tokenizer.
+        if self.cleaner is None and self.normalizer is None:
+            return self.tokenizer.tokenize_text(text)
+
         processed_text = text
 
         if self.cleaner:
@@ -39,3 +43,27 @@ class TransformerPipeline:
             processed_text = self.normalizer.normalize_text(processed_text)
 
         return self.tokenizer.tokenize_text(processed_text)
+
+    def transform_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Processes several texts through the pipeline in one call.
+
+        Each stage walks the whole batch before the next begins, so the
+        per-call logging and attribute lookups are paid once per batch
+        instead of once per text.
+
+        Args:
+            texts: Raw input texts.
+
+        Returns:
+            list[list[str]]: Resulting tokens for each input text.
+        """
+        processed_texts = texts
+
+        if self.cleaner:
+            processed_texts = self.cleaner.clean_batch(processed_texts)
+
+        if self.normalizer:
+            processed_texts = self.normalizer.normalize_batch(processed_texts)
+
+        return self.tokenizer.tokenize_batch(processed_texts)
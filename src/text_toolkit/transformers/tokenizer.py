@@ -4,3 +4,6 @@ class Tokenizer:
     def tokenize_text(self, text: str) -> list[str]:
 
         return text.split()
+
+    def tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+        return [text.split() for text in texts]
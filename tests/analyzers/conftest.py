@@ -1,12 +1,17 @@
 """Shared fixtures for analyzer tests."""
 
+import functools
+from collections.abc import Callable
+
 import pytest
 
+from text_toolkit.analyzers.analyzer_runner import AnalyzerRunner
+from text_toolkit.analyzers.core import LanguageDetector
 from text_toolkit.models.text_document import TextDocument
 from text_toolkit.transformers import Cleaner, Normalizer, Tokenizer, TransformerPipeline
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pipeline() -> TransformerPipeline:
     """Standard pipeline for testing."""
     return TransformerPipeline(
@@ -16,13 +21,13 @@ def pipeline() -> TransformerPipeline:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Empty document for edge case testing."""
     return TextDocument(content="", pipeline=pipeline)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def english_doc(pipeline: TransformerPipeline) -> TextDocument:
     """English text with positive sentiment."""
     return TextDocument(
@@ -31,7 +36,7 @@ def english_doc(pipeline: TransformerPipeline) -> TextDocument:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spanish_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Spanish text with positive sentiment."""
     return TextDocument(
@@ -40,13 +45,13 @@ def spanish_doc(pipeline: TransformerPipeline) -> TextDocument:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def chinese_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Chinese text for testing language detection edge cases."""
     return TextDocument(content="这是一个美好的一天。我喜欢学习中文非常好。", pipeline=pipeline)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def negative_sentiment_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Document with negative sentiment."""
     return TextDocument(
@@ -55,7 +60,7 @@ def negative_sentiment_doc(pipeline: TransformerPipeline) -> TextDocument:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def neutral_sentiment_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Document with neutral sentiment (no sentiment words)."""
     return TextDocument(
@@ -65,7 +70,7 @@ def neutral_sentiment_doc(pipeline: TransformerPipeline) -> TextDocument:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mixed_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Complex document with multiple sentences and mixed characteristics."""
     return TextDocument(
@@ -77,3 +82,35 @@ def mixed_doc(pipeline: TransformerPipeline) -> TextDocument:
         """,
         pipeline=pipeline,
     )
+
+
+@pytest.fixture(scope="session")
+def make_doc(pipeline: TransformerPipeline) -> Callable[[str], TextDocument]:
+    """Memoized TextDocument factory: identical content shares one document.
+
+    Safe because analyzers only read from documents.
+    """
+
+    @functools.cache
+    def _make(content: str) -> TextDocument:
+        return TextDocument(content=content, pipeline=pipeline)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def runner() -> AnalyzerRunner:
+    """Shared AnalyzerRunner with all core analyzers."""
+    return AnalyzerRunner()
+
+
+@pytest.fixture(scope="session")
+def english_result(runner: AnalyzerRunner, english_doc: TextDocument) -> dict:
+    """Shared analysis result for english_doc; analyzers are pure over it."""
+    return runner.analyze(english_doc)
+
+
+@pytest.fixture(scope="session")
+def lang_detector() -> LanguageDetector:
+    """Shared LanguageDetector for tests that pre-detect a document."""
+    return LanguageDetector()
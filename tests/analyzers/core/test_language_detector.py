@@ -142,3 +142,18 @@ class TestLanguageDetector:
         assert "LanguageDetector(" in representation
         assert "languages=" in representation
         assert "total_stopwords=" in representation
+
+    def test_language_subset_restricts_candidates(self, english_doc: TextDocument) -> None:
+        """A detector restricted to a language subset only scores those."""
+        analyzer = LanguageDetector(languages=["es"])
+        result = analyzer.analyze(english_doc)
+
+        # English stopwords cannot win when only Spanish is loaded
+        assert result["language"] in ["es", "unknown"]
+
+    def test_empty_language_subset_returns_unknown(self, english_doc: TextDocument) -> None:
+        """An empty candidate set must degrade to 'unknown', not raise."""
+        analyzer = LanguageDetector(languages=[])
+        result = analyzer.analyze(english_doc)
+
+        assert result == {"language": "unknown", "confidence": 0.0}
@@ -1,18 +1,24 @@
 """Tests for ReadabilityAnalyzer."""
 
+from collections.abc import Callable
+
 import pytest
 
-from text_toolkit.analyzers.core import ReadabilityAnalyzer
+from text_toolkit.analyzers.core import LanguageDetector, ReadabilityAnalyzer
 from text_toolkit.models.text_document import TextDocument
-from text_toolkit.transformers import TransformerPipeline
+
+
+@pytest.fixture(scope="module")
+def analyzer() -> ReadabilityAnalyzer:
+    """Shared analyzer instance for the module."""
+    return ReadabilityAnalyzer()
 
 
 class TestReadabilityAnalyzer:
     """Test suite for ReadabilityAnalyzer."""
 
-    def test_normal_document(self, english_doc: TextDocument):
+    def test_normal_document(self, analyzer: ReadabilityAnalyzer, english_doc: TextDocument):
         """Test readability analysis on a normal document."""
-        analyzer = ReadabilityAnalyzer()
         result = analyzer.analyze(english_doc)
 
         assert "avg_sentence_length" in result
@@ -22,9 +28,8 @@ class TestReadabilityAnalyzer:
         assert result["avg_word_length"] > 0
         assert result["complexity"] in ["low", "medium", "high"]
 
-    def test_empty_document(self, empty_doc: TextDocument):
+    def test_empty_document(self, analyzer: ReadabilityAnalyzer, empty_doc: TextDocument):
         """Test readability analysis on empty document."""
-        analyzer = ReadabilityAnalyzer()
         result = analyzer.analyze(empty_doc)
 
         assert result["avg_sentence_length"] == 0.0
@@ -53,36 +58,38 @@ class TestReadabilityAnalyzer:
     )
     def test_complexity_levels(
         self,
-         text: str, expected_complexity: str, pipeline: TransformerPipeline) -> None:
+        analyzer: ReadabilityAnalyzer,
+        text: str,
+        expected_complexity: str,
+        make_doc: Callable[[str], TextDocument],
+    ) -> None:
         """Test different complexity levels with various texts."""
-        doc = TextDocument(content=text, pipeline=pipeline)
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc(text)
         result = analyzer.analyze(doc)
         assert result["complexity"] == expected_complexity
 
-    def test_single_sentence(self, pipeline: TransformerPipeline) -> None:
+    def test_single_sentence(
+        self, analyzer: ReadabilityAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test document with a single sentence."""
-        doc = TextDocument(content="This is a single sentence.", pipeline=pipeline)
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("This is a single sentence.")
         result = analyzer.analyze(doc)
 
         assert result["avg_sentence_length"] > 0
         assert result["avg_word_length"] > 0
         assert result["complexity"] in ["low", "medium", "high", "unknown"]
 
-    def test_english_thresholds(self, pipeline: TransformerPipeline) -> None:
+    def test_english_thresholds(
+        self,
+        analyzer: ReadabilityAnalyzer,
+        lang_detector: LanguageDetector,
+        make_doc: Callable[[str], TextDocument],
+    ) -> None:
         """Test that English language thresholds are used."""
         # Create an English document that is clearly detected as English
-        doc = TextDocument(
-            content="The quick brown fox jumps over the lazy dog every day.",
-            pipeline=pipeline,
-        )
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("The quick brown fox jumps over the lazy dog every day.")
 
         # First, we need language detection to set the language
-        from text_toolkit.analyzers.core import LanguageDetector
-
-        lang_detector = LanguageDetector()
         lang_detector.analyze(doc)
 
         result = analyzer.analyze(doc)
@@ -90,18 +97,16 @@ class TestReadabilityAnalyzer:
         assert "complexity" in result
         # English thresholds: sent_high=25, sent_med=15, word_high=6.0, word_med=5.0
 
-    def test_spanish_thresholds(self, pipeline: TransformerPipeline) -> None:
+    def test_spanish_thresholds(
+        self,
+        analyzer: ReadabilityAnalyzer,
+        lang_detector: LanguageDetector,
+        make_doc: Callable[[str], TextDocument],
+    ) -> None:
         """Test that Spanish language thresholds are used."""
-        doc = TextDocument(
-            content="El rápido zorro marrón salta sobre el perro perezoso todos los días.",
-            pipeline=pipeline,
-        )
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("El rápido zorro marrón salta sobre el perro perezoso todos los días.")
 
         # First detect language
-        from text_toolkit.analyzers.core import LanguageDetector
-
-        lang_detector = LanguageDetector()
         lang_detector.analyze(doc)
 
         result = analyzer.analyze(doc)
@@ -109,32 +114,30 @@ class TestReadabilityAnalyzer:
         assert "complexity" in result
         # Spanish thresholds: sent_high=30, sent_med=20, word_high=6.5, word_med=5.5
 
-    def test_avg_sentence_length_calculation(self, pipeline: TransformerPipeline) -> None:
+    def test_avg_sentence_length_calculation(
+        self, analyzer: ReadabilityAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that average sentence length is correctly calculated."""
         # 3 sentences with 3, 4, and 5 words respectively = 12 words / 3 sentences = 4
-        doc = TextDocument(
-            content="I am ok. You are fine now. We all are very good.",
-            pipeline=pipeline,
-        )
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("I am ok. You are fine now. We all are very good.")
         result = analyzer.analyze(doc)
 
         # Should be 12 words / 3 sentences = 4.0
         assert result["avg_sentence_length"] == 4.0
 
-    def test_avg_word_length_calculation(self, pipeline: TransformerPipeline) -> None:
+    def test_avg_word_length_calculation(
+        self, analyzer: ReadabilityAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that average word length is correctly calculated."""
         # Words: "cat" (3), "dog" (3), "fish" (4) = total 10 chars / 3 words = 3.33
-        doc = TextDocument(content="cat dog fish", pipeline=pipeline)
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("cat dog fish")
         result = analyzer.analyze(doc)
 
         # Should be (3 + 3 + 4) / 3 = 3.33
         assert abs(result["avg_word_length"] - 3.33) < 0.01
 
-    def test_mixed_document(self, mixed_doc: TextDocument):
+    def test_mixed_document(self, analyzer: ReadabilityAnalyzer, mixed_doc: TextDocument):
         """Test readability on a complex mixed document."""
-        analyzer = ReadabilityAnalyzer()
         result = analyzer.analyze(mixed_doc)
 
         assert result["avg_sentence_length"] > 0
@@ -150,20 +153,22 @@ class TestReadabilityAnalyzer:
         assert "ReadabilityAnalyzer(" in representation
         assert "languages_available=" in representation
 
-    def test_multiple_punctuation(self, pipeline: TransformerPipeline) -> None:
+    def test_multiple_punctuation(
+        self, analyzer: ReadabilityAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that multiple punctuation marks are handled correctly."""
-        doc = TextDocument(content="Hello!!! Are you okay??? Yes!", pipeline=pipeline)
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("Hello!!! Are you okay??? Yes!")
         result = analyzer.analyze(doc)
 
         # Should have 3 sentences
         assert result["avg_sentence_length"] > 0
 
-    def test_no_language_detected(self, pipeline: TransformerPipeline) -> None:
+    def test_no_language_detected(
+        self, analyzer: ReadabilityAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test readability when no language is detected."""
         # Document with no recognizable stopwords
-        doc = TextDocument(content="xyzabc qwerty zxcvbn asdfgh", pipeline=pipeline)
-        analyzer = ReadabilityAnalyzer()
+        doc = make_doc("xyzabc qwerty zxcvbn asdfgh")
         result = analyzer.analyze(doc)
 
         # Should use default thresholds
@@ -1,47 +1,60 @@
 """Tests for SentimentAnalyzer."""
 
+from collections.abc import Callable
+
 import pytest
 
 from text_toolkit.analyzers.core import SentimentAnalyzer
 from text_toolkit.models.text_document import TextDocument
-from text_toolkit.transformers import TransformerPipeline
+
+SENTIMENT_CASES = [
+    ("This is a great day. I love English! It is excellent and amazing.", "positive"),
+    (
+        "This is a terrible day. I hate this awful situation. It is horrible and bad.",
+        "negative",
+    ),
+    (
+        "The document contains several sentences. The data was processed yesterday.",
+        "neutral",
+    ),
+    ("", "neutral"),
+    ("Es muy bueno y excelente. Maravilloso!", "positive"),
+    ("Es muy malo y terrible. Horrible!", "negative"),
+]
+
+
+@pytest.fixture(scope="module")
+def analyzer() -> SentimentAnalyzer:
+    """Shared analyzer instance for the module."""
+    return SentimentAnalyzer()
 
 
 class TestSentimentAnalyzer:
     """Test suite for SentimentAnalyzer."""
 
-    @pytest.mark.parametrize(
-        "text, expected_sentiment",
-        [
-            ("This is a great day. I love English! It is excellent and amazing.", "positive"),
-            (
-                "This is a terrible day. I hate this awful situation. It is horrible and bad.",
-                "negative",
-            ),
-            (
-                "The document contains several sentences. The data was processed yesterday.",
-                "neutral",
-            ),
-            ("", "neutral"),
-            ("Es muy bueno y excelente. Maravilloso!", "positive"),
-            ("Es muy malo y terrible. Horrible!", "negative"),
-        ],
-    )
+    @pytest.mark.parametrize("text, expected_sentiment", SENTIMENT_CASES)
     def test_sentiment_detection(
         self,
+        analyzer: SentimentAnalyzer,
         text: str,
         expected_sentiment: str,
-        pipeline: TransformerPipeline
+        make_doc: Callable[[str], TextDocument]
     ) -> None:
         """Test sentiment detection across different languages and intensities."""
-        doc = TextDocument(content=text, pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
+        doc = make_doc(text)
         result = analyzer.analyze(doc)
         assert result["sentiment"] == expected_sentiment
 
-    def test_empty_document(self, empty_doc: TextDocument):
+    def test_sentiment_detection_batch(
+        self, analyzer: SentimentAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
+        """Test the batch API against every detection case in one pass."""
+        docs = [make_doc(text) for text, _ in SENTIMENT_CASES]
+        results = analyzer.analyze_batch(docs)
+        assert [r["sentiment"] for r in results] == [e for _, e in SENTIMENT_CASES]
+
+    def test_empty_document(self, analyzer: SentimentAnalyzer, empty_doc: TextDocument):
         """Test sentiment analysis on empty document."""
-        analyzer = SentimentAnalyzer()
         result = analyzer.analyze(empty_doc)
 
         assert result["sentiment"] == "neutral"
@@ -49,12 +62,11 @@ class TestSentimentAnalyzer:
         assert result["pos_count"] == 0
         assert result["neg_count"] == 0
 
-    def test_mixed_sentiment(self, pipeline: TransformerPipeline) -> None:
+    def test_mixed_sentiment(
+        self, analyzer: SentimentAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test document with both positive and negative words."""
-        doc = TextDocument(
-            content="This is good but also bad. Great and terrible.", pipeline=pipeline
-        )
-        analyzer = SentimentAnalyzer()
+        doc = make_doc("This is good but also bad. Great and terrible.")
         result = analyzer.analyze(doc)
 
         assert result["pos_count"] > 0
@@ -63,11 +75,12 @@ class TestSentimentAnalyzer:
         assert "sentiment" in result
         assert "score" in result
 
-    def test_score_calculation(self, pipeline: TransformerPipeline) -> None:
+    def test_score_calculation(
+        self, analyzer: SentimentAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that score is correctly calculated."""
         # Document with 3 positive and 1 negative word
-        doc = TextDocument(content="good great excellent bad", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
+        doc = make_doc("good great excellent bad")
         result = analyzer.analyze(doc)
 
         # Score should be (3 - 1) / (3 + 1) = 2/4 = 0.5
@@ -75,50 +88,48 @@ class TestSentimentAnalyzer:
         assert result["pos_count"] == 3
         assert result["neg_count"] == 1
 
-    def test_sentiment_threshold_positive(self, pipeline: TransformerPipeline) -> None:
-        """Test positive sentiment threshold (> 0.1)."""
-        # Slightly positive: 2 positive, 1 negative -> (2-1)/(2+1) = 0.33
-        doc = TextDocument(content="good great bad", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze(doc)
-
-        assert result["score"] > 0.1
-        assert result["sentiment"] == "positive"
-
-    def test_sentiment_threshold_negative(self, pipeline: TransformerPipeline) -> None:
-        """Test negative sentiment threshold (< -0.1)."""
-        # Slightly negative: 1 positive, 2 negative -> (1-2)/(1+2) = -0.33
-        doc = TextDocument(content="good bad terrible", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze(doc)
-
-        assert result["score"] < -0.1
-        assert result["sentiment"] == "negative"
-
-    def test_sentiment_threshold_neutral_edge(self, pipeline: TransformerPipeline) -> None:
-        """Test neutral sentiment at edge of threshold."""
-        # Exactly balanced: 1 positive, 1 negative -> (1-1)/(1+1) = 0.0
-        doc = TextDocument(content="good bad", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
+    @pytest.mark.parametrize(
+        "text, expected_score, expected_sentiment",
+        [
+            # Slightly positive: 2 positive, 1 negative -> (2-1)/(2+1) = 0.33
+            ("good great bad", 0.33, "positive"),
+            # Slightly negative: 1 positive, 2 negative -> (1-2)/(1+2) = -0.33
+            ("good bad terrible", -0.33, "negative"),
+            # Exactly balanced: 1 positive, 1 negative -> (1-1)/(1+1) = 0.0
+            ("good bad", 0.0, "neutral"),
+        ],
+    )
+    def test_sentiment_thresholds(
+        self,
+        analyzer: SentimentAnalyzer,
+        text: str,
+        expected_score: float,
+        expected_sentiment: str,
+        make_doc: Callable[[str], TextDocument],
+    ) -> None:
+        """Test the positive (> 0.1) / negative (< -0.1) / neutral thresholds."""
+        doc = make_doc(text)
         result = analyzer.analyze(doc)
 
-        assert result["score"] == 0.0
-        assert result["sentiment"] == "neutral"
+        assert result["score"] == pytest.approx(expected_score)
+        assert result["sentiment"] == expected_sentiment
 
-    def test_case_insensitivity(self, pipeline: TransformerPipeline) -> None:
+    def test_case_insensitivity(
+        self, analyzer: SentimentAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that sentiment words are matched case-insensitively."""
-        doc = TextDocument(content="GOOD Great EXCELLENT", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
+        doc = make_doc("GOOD Great EXCELLENT")
         result = analyzer.analyze(doc)
 
         # All should be recognized as positive
         assert result["pos_count"] == 3
         assert result["sentiment"] == "positive"
 
-    def test_repeated_sentiment_words(self, pipeline: TransformerPipeline) -> None:
+    def test_repeated_sentiment_words(
+        self, analyzer: SentimentAnalyzer, make_doc: Callable[[str], TextDocument]
+    ) -> None:
         """Test that repeated sentiment words are counted multiple times."""
-        doc = TextDocument(content="good good good bad", pipeline=pipeline)
-        analyzer = SentimentAnalyzer()
+        doc = make_doc("good good good bad")
         result = analyzer.analyze(doc)
 
         assert result["pos_count"] == 3
@@ -1,17 +1,21 @@
 """Tests for AnalyzerRunner."""
 
 from text_toolkit.analyzers.analyzer_runner import AnalyzerRunner
-from text_toolkit.analyzers.core import FrequencyAnalyzer, LanguageDetector
+from text_toolkit.analyzers.core import (
+    FrequencyAnalyzer,
+    LanguageDetector,
+    ReadabilityAnalyzer,
+    SentimentAnalyzer,
+)
 from text_toolkit.models.text_document import TextDocument
 
 
 class TestAnalyzerRunner:
     """Test suite for AnalyzerRunner."""
 
-    def test_all_analyzers_executed(self, english_doc: TextDocument):
+    def test_all_analyzers_executed(self, english_result: dict):
         """Test that all analyzers are executed and results are present."""
-        runner = AnalyzerRunner()
-        result = runner.analyze(english_doc)
+        result = english_result
 
         # Frequency analyzer results
         assert "total_words" in result
@@ -34,10 +38,9 @@ class TestAnalyzerRunner:
         assert "avg_word_length" in result
         assert "complexity" in result
 
-    def test_flat_structure(self, english_doc: TextDocument):
+    def test_flat_structure(self, english_result: dict):
         """Test that results are returned in a flat dictionary structure."""
-        runner = AnalyzerRunner()
-        result = runner.analyze(english_doc)
+        result = english_result
 
         # Should be a flat dict, not nested
         assert isinstance(result, dict)
@@ -49,9 +52,8 @@ class TestAnalyzerRunner:
         assert "frequency" not in result
         assert "language_detector" not in result
 
-    def test_empty_document(self, empty_doc: TextDocument):
+    def test_empty_document(self, runner: AnalyzerRunner, empty_doc: TextDocument):
         """Test that all analyzers handle empty documents gracefully."""
-        runner = AnalyzerRunner()
         result = runner.analyze(empty_doc)
 
         # Frequency analyzer empty results
@@ -71,38 +73,36 @@ class TestAnalyzerRunner:
         assert result["avg_word_length"] == 0.0
         assert result["complexity"] == "unknown"
 
-    def test_positive_sentiment_document(self, english_doc: TextDocument):
+    def test_positive_sentiment_document(self, english_result: dict):
         """Test runner with a positive sentiment document."""
-        runner = AnalyzerRunner()
-        result = runner.analyze(english_doc)
+        result = english_result
 
         assert result["sentiment"] == "positive"
         assert result["score"] > 0
         assert result["language"] == "en"
         assert result["total_words"] > 0
 
-    def test_negative_sentiment_document(self, negative_sentiment_doc: TextDocument):
+    def test_negative_sentiment_document(
+        self, runner: AnalyzerRunner, negative_sentiment_doc: TextDocument
+    ):
         """Test runner with a negative sentiment document."""
-        runner = AnalyzerRunner()
         result = runner.analyze(negative_sentiment_doc)
 
         assert result["sentiment"] == "negative"
         assert result["score"] < 0
         assert result["neg_count"] > 0
 
-    def test_spanish_document(self, spanish_doc: TextDocument):
+    def test_spanish_document(self, runner: AnalyzerRunner, spanish_doc: TextDocument):
         """Test runner with a Spanish document."""
-        runner = AnalyzerRunner()
         result = runner.analyze(spanish_doc)
 
         assert result["language"] == "es"
         assert result["sentiment"] == "positive"
         assert result["total_words"] > 0
 
-    def test_consistency_across_analyzers(self, english_doc: TextDocument):
+    def test_consistency_across_analyzers(self, english_result: dict):
         """Test that analyzers produce consistent results."""
-        runner = AnalyzerRunner()
-        result = runner.analyze(english_doc)
+        result = english_result
 
         # Word count from frequency analyzer should be consistent
         # with the number of tokens used by other analyzers
@@ -114,9 +114,8 @@ class TestAnalyzerRunner:
         # Sentiment should be one of the valid values
         assert result["sentiment"] in ["positive", "negative", "neutral"]
 
-    def test_multiple_runs_same_document(self, english_doc: TextDocument):
+    def test_multiple_runs_same_document(self, runner: AnalyzerRunner, english_doc: TextDocument):
         """Test that running the same document multiple times gives consistent results."""
-        runner = AnalyzerRunner()
         result1 = runner.analyze(english_doc)
         result2 = runner.analyze(english_doc)
 
@@ -127,19 +126,19 @@ class TestAnalyzerRunner:
         assert result1["score"] == result2["score"]
         assert result1["complexity"] == result2["complexity"]
 
-    def test_different_documents(self, english_doc: TextDocument, spanish_doc: TextDocument):
+    def test_different_documents(
+        self, runner: AnalyzerRunner, english_doc: TextDocument, spanish_doc: TextDocument
+    ):
         """Test that different documents produce different results."""
-        runner = AnalyzerRunner()
         en_result = runner.analyze(english_doc)
         es_result = runner.analyze(spanish_doc)
 
         # Languages should be different
         assert en_result["language"] != es_result["language"]
 
-    def test_result_types(self, english_doc: TextDocument):
+    def test_result_types(self, english_result: dict):
         """Test that all result values have the correct types."""
-        runner = AnalyzerRunner()
-        result = runner.analyze(english_doc)
+        result = english_result
 
         # Frequency analyzer
         assert isinstance(result["total_words"], int)
@@ -168,13 +167,6 @@ class TestAnalyzerRunner:
 
         assert len(runner.analyzers) == 4
         # Verify all analyzer types are present
-        from text_toolkit.analyzers.core import (
-            FrequencyAnalyzer,
-            LanguageDetector,
-            ReadabilityAnalyzer,
-            SentimentAnalyzer,
-        )
-
         analyzer_types = [type(a) for a in runner.analyzers]
         assert FrequencyAnalyzer in analyzer_types
         assert LanguageDetector in analyzer_types
@@ -0,0 +1,35 @@
+"""Shared fixtures for CLI tests."""
+
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture(scope="module")
+def recording_console() -> Console:
+    """Single non-terminal recording console shared by a test module.
+
+    Building one console per module skips repeated terminal detection and
+    keeps display tests from writing to the real stdout.
+    """
+    return Console(record=True, width=120, force_terminal=False)
+
+
+@pytest.fixture(scope="session")
+def sample_doc_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample document written once for all read-only process_document tests."""
+    path = tmp_path_factory.mktemp("cli") / "document.txt"
+    path.write_text(
+        "Contact: admin@example.com. Visit https://example.com on 2026-03-15.",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture(scope="session")
+def transformers_doc_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Raw-text document for transformers-only runs, written once."""
+    path = tmp_path_factory.mktemp("cli") / "document_transformers.txt"
+    path.write_text("  HOLA   mundo!!!  ", encoding="utf-8")
+    return path
@@ -1,3 +1,7 @@
+import pytest
+from rich.console import Console
+
+from text_toolkit import cli_display
 from text_toolkit.cli_display import (
     _build_extraction_data_for_json,
     _build_json_output,
@@ -74,7 +78,10 @@ def test_format_extraction_sample_limits_and_handles_empty() -> None:
     assert empty == "(none)"
 
 
-def test_display_results_text_and_json_do_not_raise() -> None:
+def test_display_results_text_and_json_do_not_raise(
+    monkeypatch: pytest.MonkeyPatch, recording_console: Console
+) -> None:
+    monkeypatch.setattr(cli_display, "console", recording_console)
     analyzer_results = {"total_words": 10}
     extraction_result = _make_extraction_result()
 
@@ -85,7 +92,10 @@ def test_display_results_text_and_json_do_not_raise() -> None:
     display_results("json", analyzer_results, extraction_result)
 
 
-def test_display_transformer_results_text_and_json_do_not_raise() -> None:
+def test_display_transformer_results_text_and_json_do_not_raise(
+    monkeypatch: pytest.MonkeyPatch, recording_console: Console
+) -> None:
+    monkeypatch.setattr(cli_display, "console", recording_console)
     transformer_results = {
         "Cleaner": "clean text",
         "Normalizer": "normalized text",
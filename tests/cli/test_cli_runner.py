@@ -102,15 +102,9 @@ def test_apply_transformers_to_content_uses_selected_transformers() -> None:
     assert transformed_default
 
 
-def test_process_document_runs_analyzers_and_extractors(tmp_path: Path) -> None:
-    file_path = tmp_path / "document.txt"
-    file_path.write_text(
-        "Contact: admin@example.com. Visit https://example.com on 2026-03-15.",
-        encoding="utf-8",
-    )
-
+def test_process_document_runs_analyzers_and_extractors(sample_doc_path: Path) -> None:
     config = CLIConfig(
-        input_path=str(file_path),
+        input_path=str(sample_doc_path),
         output="text",
         verbose=False,
         analyzers=None,
@@ -127,12 +121,9 @@ def test_process_document_runs_analyzers_and_extractors(tmp_path: Path) -> None:
     assert "admin@example.com" in extractor_results.email_matches
 
 
-def test_process_document_transformers_only_mode(tmp_path: Path) -> None:
-    file_path = tmp_path / "document_transformers.txt"
-    file_path.write_text("  HOLA   mundo!!!  ", encoding="utf-8")
-
+def test_process_document_transformers_only_mode(transformers_doc_path: Path) -> None:
     config = CLIConfig(
-        input_path=str(file_path),
+        input_path=str(transformers_doc_path),
         output="json",
         verbose=False,
         analyzers=None,
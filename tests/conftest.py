@@ -6,7 +6,7 @@ from text_toolkit.models.text_document import TextDocument
 from text_toolkit.transformers import Cleaner, Normalizer, Tokenizer, TransformerPipeline
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pipeline() -> TransformerPipeline:
     """Standard pipeline for testing."""
     return TransformerPipeline(
@@ -16,7 +16,7 @@ def pipeline() -> TransformerPipeline:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_doc(pipeline: TransformerPipeline) -> TextDocument:
     """Empty document for edge case testing."""
     return TextDocument(content="", pipeline=pipeline)
@@ -5,7 +5,8 @@ import pytest
 from text_toolkit.extractors import ExtractorRunner
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extractor_runner():
-    """Fixture that provides an ExtractorRunner instance."""
+    """Session-scoped: the runner is stateless per call, so pattern
+    compilation is paid once for the whole suite."""
     return ExtractorRunner()
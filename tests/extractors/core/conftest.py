@@ -1,5 +1,8 @@
 """Shared fixtures for core extractor tests."""
 
+from collections.abc import Callable
+from functools import cache
+
 import pytest
 
 from text_toolkit.extractors.core import (
@@ -11,25 +14,25 @@ from text_toolkit.extractors.core import (
 from text_toolkit.transformers.normalizer import Normalizer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def email_extractor():
     """Fixture that provides an EmailExtractor instance."""
     return EmailExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def url_extractor():
     """Fixture that provides a URLExtractor instance."""
     return URLExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def date_extractor():
     """Fixture that provides a DateExtractor instance."""
     return DateExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_phone_extractor():
     """Fixture that provides a CustomExtractor pre-configured for phone patterns."""
     return CustomExtractor(
@@ -38,7 +41,7 @@ def custom_phone_extractor():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_ip_extractor():
     """Fixture that provides a CustomExtractor pre-configured for IP addresses."""
     return CustomExtractor(
@@ -47,7 +50,18 @@ def custom_ip_extractor():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def normalizer():
     """Fixture that provides a Normalizer instance."""
     return Normalizer()
+
+
+@pytest.fixture(scope="session")
+def extractor_factory() -> Callable[[str, tuple[str, ...]], CustomExtractor]:
+    """Cached CustomExtractor factory keyed by (name, patterns tuple)."""
+
+    @cache
+    def _make(name: str, patterns: tuple[str, ...]) -> CustomExtractor:
+        return CustomExtractor(name=name, patterns=list(patterns))
+
+    return _make
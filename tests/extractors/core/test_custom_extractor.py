@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pytest
 
 from text_toolkit.extractors.core import CustomExtractor
@@ -86,10 +88,16 @@ def test_create_with_patterns(name: str, patterns: list[str], expected_count: in
     ],
 )
 def test_extract_from_various_patterns(
-    name: str, patterns: list[str], text: str, expected: list[str], unique_occurrences: bool
+    *,
+    name: str,
+    patterns: list[str],
+    text: str,
+    expected: list[str],
+    unique_occurrences: bool,
+    extractor_factory: Callable[[str, tuple[str, ...]], CustomExtractor],
 ):
     """Should extract matches for various patterns and modes."""
-    extractor = CustomExtractor(name=name, patterns=patterns)
+    extractor = extractor_factory(name, tuple(patterns))
     extracted_data = extractor.extract(text, unique_occurrences=unique_occurrences)
 
     assert isinstance(extracted_data, list), "Data structure should be a List"
@@ -98,6 +106,25 @@ def test_extract_from_various_patterns(
         assert extracted_data.count(value) == expected.count(value)
 
 
+def test_extract_with_capturing_groups_keeps_findall_semantics():
+    """Patterns with groups must not be fused: backreference numbering and
+    findall's return-the-group contract both depend on per-pattern runs."""
+    # findall returns the captured group, so each doubled letter yields
+    # its single-letter capture — and crucially both patterns match.
+    backref_extractor = CustomExtractor(name="doubled", patterns=[r"(a)\1", r"(b)\1"])
+    assert backref_extractor.extract("aa bb") == ["a", "b"]
+
+    group_extractor = CustomExtractor(name="item", patterns=[r"(\d+)-item"])
+    assert group_extractor.extract("12-item 34-item") == ["12", "34"]
+
+
+def test_extract_with_overlapping_patterns_reports_both():
+    """Each registered pattern scans independently, so patterns that
+    overlap on the same span both report their match."""
+    extractor = CustomExtractor(name="overlap", patterns=["ab", "abc"])
+    assert extractor.extract("abc") == ["ab", "abc"]
+
+
 def test_invalid_regex_pattern():
     """Should raise ValueError when regex pattern is invalid."""
     with pytest.raises(ValueError) as exc_info:
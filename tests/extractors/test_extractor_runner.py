@@ -123,3 +123,56 @@ def test_extractor_runner_repr_includes_active_extractors(
     assert "email" in representation
     assert "url" in representation
     assert "date" in representation
+
+
+def test_extractor_runner_extract_all_stream_matches_content_mode(
+    extractor_runner: ExtractorRunner,
+) -> None:
+    """Streaming extraction should find the same matches as content mode."""
+    lines = [
+        "Contact: admin@example.com, visit https://example.com",
+        "Released on 2026-03-15 and again admin@example.com",
+        "Date split across lines: 01 jan",
+        "2026 closes the report",
+    ]
+    result = extractor_runner.extract_all_stream(iter(lines))
+
+    assert result.email_matches == ["admin@example.com"]
+    assert result.url_matches == ["https://example.com"]
+    assert "2026-03-15" in result.date_matches
+    assert "01 jan\n2026" in result.date_matches
+
+
+def test_extractor_runner_extract_all_batch_matches_per_document_results(
+    extractor_runner: ExtractorRunner, pipeline: TransformerPipeline
+) -> None:
+    """Batch extraction should equal running extract_all per document."""
+    documents = [
+        TextDocument(content="Contact: admin@example.com on 2026-03-15", pipeline=pipeline),
+        TextDocument(
+            content="Visit https://example.com and https://example.com", pipeline=pipeline
+        ),
+        TextDocument(content="", pipeline=pipeline),
+    ]
+
+    batch_results = extractor_runner.extract_all_batch(documents)
+
+    assert len(batch_results) == len(documents)
+    for document, batch_result in zip(documents, batch_results, strict=True):
+        single = extractor_runner.extract_all(document)
+        assert batch_result.email_matches == single.email_matches
+        assert batch_result.url_matches == single.url_matches
+        assert batch_result.date_matches == single.date_matches
+
+
+def test_extractor_runner_reports_overlapping_matches(
+    extractor_runner: ExtractorRunner, pipeline: TransformerPipeline
+):
+    """A value embedded in another extractor's match is still reported."""
+    document = TextDocument(
+        content="See https://example.com/2026-03-15 only", pipeline=pipeline
+    )
+    result = extractor_runner.extract_all(document)
+
+    assert result.url_matches == ["https://example.com/2026-03-15"]
+    assert result.date_matches == ["2026-03-15"]
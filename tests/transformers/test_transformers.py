@@ -29,6 +29,15 @@ def test_cleaner_preserves_emails_urls_dates():
     assert "15/03/2026!" not in cleaned
 
 
+def test_cleaner_collapses_punctuation_next_to_protected_values():
+    c = Cleaner()
+    # Punctuation adjacent to whitespace around a protected value must
+    # collapse to a single space, not one space per run.
+    cleaned = c.clean_text("Contacto: admin@example.com. Visita https://example.com!")
+    assert cleaned == "Contacto admin@example.com Visita https://example.com"
+    assert c.clean_text("café... bien") == "café bien"
+
+
 def test_tokenizer_splits_by_spaces():
     t = Tokenizer()
     tokens = t.tokenize_text("hola   mundo  prueba")
@@ -47,5 +56,14 @@ def test_transformer_pipeline_integration():
     assert tokens == ["hola", "mundo"]
 
 
+def test_transformer_pipeline_batch_matches_single_transform():
+    pipeline = TransformerPipeline(
+        tokenizer=Tokenizer(), cleaner=Cleaner(), normalizer=Normalizer()
+    )
+    texts = ["  HOLA   mundo!!!  ", "Visita https://example.com ya!"]
+    batched = pipeline.transform_batch(texts)
+    assert batched == [pipeline.transform(text) for text in texts]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])